@@ -22,26 +22,59 @@ The functions of primary interest provided by this module are phase(),
 which gives you a variety of data on the status of the moon for a
 given date; and phase_hunt(), which given a date, finds the dates of
 the nearest full moon, new moon, etc.
+
+If NumPy is installed, phase_vector() does the same work as phase()
+for a whole array of dates at once.  If Numba is installed, the
+arithmetic behind phase() and phase_hunt() is compiled to native code.
 """
 import math
 from math import sin, cos, floor, sqrt, tan, atan
-import bisect
+from bisect import bisect
+import functools
+from collections import namedtuple
 from datetime import datetime, timedelta
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit, leaving the function as plain Python."""
+        return lambda function: function
+
 
 def datetime_to_days(dt):
-    delta = dt - datetime(1, 1, 1)
-    return delta.total_seconds() / (60 * 60 * 24)
+    # Naive datetimes are taken to be UTC already
+    offset = dt.utcoffset()
+    if offset:
+        dt = dt - offset
+    seconds = dt.hour * 3600 + dt.minute * 60 + dt.second + dt.microsecond * 1e-6
+    return dt.toordinal() - 1 + seconds / (60 * 60 * 24)
 
 
 def datetime_to_julian_days(dt):
     return datetime_to_days(dt) + 1721424.5 + 1
 
 
+def datetime_to_julian_days_vec(dates):
+    """Like datetime_to_julian_days(), for a numpy.datetime64 array."""
+    # Go through microseconds, since year 1 does not fit in the
+    # nanosecond datetime64 that pandas uses by default.  Counting from
+    # the Modified Julian Date epoch, 1858 November 17.0, keeps the
+    # float64 day count small.
+    mjd = ((dates.astype('datetime64[us]') - np.datetime64('1858-11-17', 'us'))
+           / np.timedelta64(1, 'D'))
+    return mjd + 2400000.5
+
+
 def julian_days_to_datetime(julian_days):
     days = julian_days - (1721424.5 + 1)
-    seconds = days * (60 * 60 * 24)
-    return datetime(1, 1, 1) + timedelta(seconds=seconds)
+    whole_days = floor(days)
+    return datetime.fromordinal(whole_days + 1) + timedelta(days=days - whole_days)
 
 
 __TODO__ = [
@@ -75,26 +108,96 @@ class MoonPhase:
         full_date - the date of the full moon in this cycle
         q3_date - the date the moon reaches 3rd quarter in this cycle
         nextnew_date - the date of the next new moon
+        key_dates - the five dates above, as a tuple in that order
+
+    The phase data and the dates are only calculated when first asked
+    for.  I use __slots__, so no other attributes can be set on me.
     """
 
-    def __init__(self, date=datetime.utcnow()):
+    __slots__ = ('date', '_result', '_phases')
+
+    def __init__(self, date=None):
         """MoonPhase constructor.
 
-        Give me a date, as DateTime object."""
+        Give me a date, as DateTime object.  Defaults to the current
+        time (UTC)."""
+        if date is None:
+            date = datetime.utcnow()
         self.date = date
+        self._result = None
+        self._phases = None
+
+    def _phase_data(self):
+        if self._result is None:
+            self._result = _phase_result(self.date)
+        return self._result
+
+    def _phase_dates(self):
+        if self._phases is None:
+            self._phases = tuple(phase_hunt(self.date))
+        return self._phases
+
+    @property
+    def phase(self):
+        return self._phase_data().phase
+
+    @property
+    def phase_text(self):
+        return phase_string(self.phase)
+
+    @property
+    def illuminated(self):
+        return self._phase_data().illuminated
+
+    @property
+    def age(self):
+        return self._phase_data().age
+
+    @property
+    def distance(self):
+        return self._phase_data().distance
+
+    @property
+    def angular_diameter(self):
+        return self._phase_data().angular_diameter
+
+    @property
+    def sun_distance(self):
+        return self._phase_data().sun_distance
+
+    @property
+    def sun_angular_diameter(self):
+        return self._phase_data().sun_angular_diameter
+
+    @property
+    def new_date(self):
+        return self._phase_dates()[0]
 
-        self.__dict__.update(phase(self.date))
+    @property
+    def q1_date(self):
+        return self._phase_dates()[1]
 
-        self.phase_text = phase_string(self.phase)
+    @property
+    def full_date(self):
+        return self._phase_dates()[2]
 
-    def __getattr__(self, a):
-        if a in ['new_date', 'q1_date', 'full_date', 'q3_date',
-                 'nextnew_date']:
-            (self.new_date, self.q1_date, self.full_date,
-             self.q3_date, self.nextnew_date) = phase_hunt(self.date)
+    @property
+    def q3_date(self):
+        return self._phase_dates()[3]
 
-            return getattr(self, a)
-        raise AttributeError(a)
+    @property
+    def nextnew_date(self):
+        return self._phase_dates()[4]
+
+    @property
+    def key_dates(self):
+        return self._phase_dates()
+
+    @staticmethod
+    def phases_for_dates(dates):
+        """Give me an array of dates, and I return the phase for each as
+        a numpy array, as phase_vector() does.  Requires NumPy."""
+        return phase_vector(dates)['phase']
 
     def __repr__(self):
         jdn = datetime_to_julian_days(self.date)
@@ -163,38 +266,71 @@ LUNATIONS_BASE = 2423436.0
 # Properties of the Earth
 EARTH_RADIUS = 6378.16
 
+# Terms of phase() which depend only on the constants above
+
+# Mean motion of the Sun, in degrees per day
+_N_COEF = 360 / 365.2422
+# Offset from perigee coordinates to epoch 1980
+_LAMBDA_OFFSET = ECLIPTIC_LONGITUDE_EPOCH - ECLIPTIC_LONGITUDE_PERIGEE
+# Factor from the eccentric to the true anomaly, tan(v/2) = k tan(E/2)
+_KEPLER_SQRT = sqrt((1 + ECCENTRICITY) / (1 - ECCENTRICITY))
+_ONE_MINUS_ECC2 = 1 - ECCENTRICITY ** 2
+# Semi-latus rectum of the Moon's orbit, in kilometers
+_MOON_DIST_NUM = MOON_SMAXIS * (1 - MOON_ECCENTRICITY ** 2)
+
+
+# Degrees to radians and back, saving a math.radians() call per use
+_D2R = math.pi / 180.0
+_R2D = 180.0 / math.pi
+
 
 # Little handy mathematical functions.
+@njit(cache=True, fastmath=True)
 def norm_angle(angle: float) -> float:
+    # Python's float % is fmod() shifted into 0 .. 360 for negative
+    # angles, as in moontool.c.  It is quicker than an explicit
+    # math.fmod() plus test, and Numba compiles it natively.
     return angle % 360.0
 
 
+@njit(cache=True, fastmath=True)
 def dsin(d):
-    return sin(math.radians(d))
+    return sin(d * _D2R)
 
 
+@njit(cache=True, fastmath=True)
 def dcos(d):
-    return cos(math.radians(d))
+    return cos(d * _D2R)
+
+
+# Upper bounds of each phase_string() description, and the descriptions
+_PHASE_KEYS = (
+    NEW_MOON + PRECISION,
+    FIRST_QUARTER - PRECISION,
+    FIRST_QUARTER + PRECISION,
+    FULL_MOON - PRECISION,
+    FULL_MOON + PRECISION,
+    LAST_QUARTER - PRECISION,
+    LAST_QUARTER + PRECISION,
+    NEXT_NEW - PRECISION,
+    NEXT_NEW + PRECISION)
+_PHASE_LABELS = (
+    "new",
+    "waxing crescent",
+    "first quarter",
+    "waxing gibbous",
+    "full",
+    "waning gibbous",
+    "last quarter",
+    "waning crescent",
+    "new")
 
 
 def phase_string(p):
-    phase_strings = (
-        (NEW_MOON + PRECISION, "new"),
-        (FIRST_QUARTER - PRECISION, "waxing crescent"),
-        (FIRST_QUARTER + PRECISION, "first quarter"),
-        (FULL_MOON - PRECISION, "waxing gibbous"),
-        (FULL_MOON + PRECISION, "full"),
-        (LAST_QUARTER - PRECISION, "waning gibbous"),
-        (LAST_QUARTER + PRECISION, "last quarter"),
-        (NEXT_NEW - PRECISION, "waning crescent"),
-        (NEXT_NEW + PRECISION, "new"))
-
-    i = bisect.bisect([a[0] for a in phase_strings], p)
+    return _PHASE_LABELS[bisect(_PHASE_KEYS, p)]
 
-    return phase_strings[i][1]
 
-
-def phase(phase_date=datetime.utcnow()):
+def phase(phase_date=None):
     """Calculate phase of moon as a fraction:
 
     The argument is the time for which the phase is requested,
@@ -205,28 +341,65 @@ def phase(phase_date=datetime.utcnow()):
     fraction of the Moon's disc, the Moon's age in days and fraction,
     the distance of the Moon from the centre of the Earth, and the
     angular diameter subtended by the Moon as seen by an observer at
-    the centre of the Earth."""
+    the centre of the Earth.  The time defaults to now."""
+
+    return _phase_result(phase_date)._asdict()
+
+
+# What phase() calculates, as a tuple
+_PhaseResult = namedtuple('_PhaseResult',
+                          'phase illuminated age distance angular_diameter '
+                          'sun_distance sun_angular_diameter')
+
+
+def _phase_result(phase_date):
+    """Like phase(), but returns a _PhaseResult."""
+
+    if phase_date is None:
+        phase_date = datetime.utcnow()
+    if isinstance(phase_date, datetime):
+        jdn = datetime_to_julian_days(phase_date)
+    else:
+        jdn = phase_date
+
+    return _phase(round(jdn, 6))
+
+
+@functools.lru_cache(maxsize=4096)
+@njit(cache=True, fastmath=True)
+def _phase(jdn):
+    """Do the work of phase() for a Julian Day Number.
+
+    Results are cached, so the JDN should be rounded by the caller to
+    keep nearly identical dates on the same entry."""
+
+    # Local names are quicker to look up than globals
+    sin_ = sin
+    cos_ = cos
 
     # Calculation of the Sun's position
 
     # date within the epoch
-    day = datetime_to_julian_days(phase_date) - EPOCH
+    day = jdn - EPOCH
+
+    # Angles which only feed sin(), cos() or the final age of the Moon
+    # are not normalized to 0 .. 360.
 
     # Mean anomaly of the Sun
-    N = norm_angle((360 / 365.2422) * day)
+    N = _N_COEF * day
     # Convert from perigee coordinates to epoch 1980
-    M = norm_angle(N + ECLIPTIC_LONGITUDE_EPOCH - ECLIPTIC_LONGITUDE_PERIGEE)
+    M = N + _LAMBDA_OFFSET
 
     # Solve Kepler's equation
     Ec = kepler(M, ECCENTRICITY)
-    Ec = sqrt((1 + ECCENTRICITY) / (1 - ECCENTRICITY)) * tan(Ec / 2.0)
+    Ec = _KEPLER_SQRT * tan(Ec / 2.0)
     # True anomaly
-    Ec = 2 * math.degrees(atan(Ec))
+    Ec = 2 * atan(Ec) * _R2D
     # Sun's geometric ecliptic longitude
-    lambda_sun = norm_angle(Ec + ECLIPTIC_LONGITUDE_PERIGEE)
+    lambda_sun = Ec + ECLIPTIC_LONGITUDE_PERIGEE
 
     # Orbital distance factor
-    F = ((1 + ECCENTRICITY * cos(math.radians(Ec))) / (1 - ECCENTRICITY ** 2))
+    F = ((1 + ECCENTRICITY * cos_(Ec * _D2R)) / _ONE_MINUS_ECC2)
 
     # Distance to Sun in km
     sun_dist = SUN_SMAXIS / F
@@ -237,35 +410,37 @@ def phase(phase_date=datetime.utcnow()):
     # Calculation of the Moon's position
 
     # Moon's mean longitude
-    moon_longitude = norm_angle(13.1763966 * day + MOON_MEAN_LONGITUDE_EPOCH)
+    moon_longitude = 13.1763966 * day + MOON_MEAN_LONGITUDE_EPOCH
 
     # Moon's mean anomaly
-    MM = norm_angle(moon_longitude - 0.1114041 * day - MOON_MEAN_PERIGEE_EPOCH)
+    MM = moon_longitude - 0.1114041 * day - MOON_MEAN_PERIGEE_EPOCH
 
     # Moon's ascending node mean longitude
     # MN = norm_angle(c.node_mean_longitude_epoch - 0.0529539 * day)
 
-    evection = 1.2739 * sin(math.radians(2 * (moon_longitude - lambda_sun) - MM))
+    evection = 1.2739 * sin_((2 * (moon_longitude - lambda_sun) - MM) * _D2R)
+
+    sin_M = sin_(M * _D2R)
 
     # Annual equation
-    annual_eq = 0.1858 * sin(math.radians(M))
+    annual_eq = 0.1858 * sin_M
 
     # Correction term
-    A3 = 0.37 * sin(math.radians(M))
+    A3 = 0.37 * sin_M
 
     MmP = MM + evection - annual_eq - A3
 
     # Correction for the equation of the centre
-    mEc = 6.2886 * sin(math.radians(MmP))
+    mEc = 6.2886 * sin_(MmP * _D2R)
 
     # Another correction term
-    A4 = 0.214 * sin(math.radians(2 * MmP))
+    A4 = 0.214 * sin_(2 * MmP * _D2R)
 
     # Corrected longitude
     lP = moon_longitude + evection + mEc - annual_eq + A4
 
     # Variation
-    variation = 0.6583 * sin(math.radians(2 * (lP - lambda_sun)))
+    variation = 0.6583 * sin_(2 * (lP - lambda_sun) * _D2R)
 
     # True longitude
     lPP = lP + variation
@@ -297,10 +472,10 @@ def phase(phase_date=datetime.utcnow()):
     moon_age = lPP - lambda_sun
 
     # Phase of the Moon
-    moon_phase = (1 - cos(math.radians(moon_age))) / 2.0
+    moon_phase = (1 - cos_(moon_age * _D2R)) / 2.0
 
     # Calculate distance of Moon from the centre of the Earth
-    moon_dist = (MOON_SMAXIS * (1 - MOON_ECCENTRICITY ** 2)) / (1 + MOON_ECCENTRICITY * cos(math.radians(MmP + mEc)))
+    moon_dist = _MOON_DIST_NUM / (1 + MOON_ECCENTRICITY * cos_((MmP + mEc) * _D2R))
 
     # Calculate Moon's angular diameter
     moon_diam_frac = moon_dist / MOON_SMAXIS
@@ -309,10 +484,87 @@ def phase(phase_date=datetime.utcnow()):
     # Calculate Moon's parallax (unused?)
     # moon_parallax = c.moon_parallax / moon_diam_frac
 
+    age_frac = norm_angle(moon_age) / 360.0
+
+    return _PhaseResult(age_frac,
+                        moon_phase,
+                        SYNODIC_MONTH * age_frac,
+                        moon_dist,
+                        moon_angular_diameter,
+                        sun_dist,
+                        sun_angular_diameter)
+
+
+def phase_vector(dates):
+    """Calculate phase of moon for an array of dates.
+
+    The argument is either an array of numpy.datetime64 (or datetime)
+    values, or an array of Julian Day Numbers.
+
+    Returns a dictionary with the same keys as phase(), each mapping to
+    a numpy array with one element per date.  Requires NumPy."""
+
+    if np is None:
+        raise ImportError("phase_vector() requires numpy")
+
+    dates = np.asarray(dates)
+    if dates.dtype == object:
+        dates = dates.astype('datetime64[us]')
+    if np.issubdtype(dates.dtype, np.datetime64):
+        jdn = datetime_to_julian_days_vec(dates)
+    else:
+        jdn = dates.astype(np.float64)
+
+    # Calculation of the Sun's position, see phase() for the details.
+    day = jdn - EPOCH
+
+    N = _N_COEF * day
+    M = N + _LAMBDA_OFFSET
+
+    Ec = kepler_vector(M, ECCENTRICITY)
+    Ec = _KEPLER_SQRT * np.tan(Ec / 2.0)
+    Ec = 2 * np.degrees(np.arctan(Ec))
+    lambda_sun = Ec + ECLIPTIC_LONGITUDE_PERIGEE
+
+    F = ((1 + ECCENTRICITY * np.cos(np.radians(Ec))) / _ONE_MINUS_ECC2)
+
+    sun_dist = SUN_SMAXIS / F
+    sun_angular_diameter = F * SUN_ANGULAR_SIZE_SMAXIS
+
+    # Calculation of the Moon's position
+
+    moon_longitude = 13.1763966 * day + MOON_MEAN_LONGITUDE_EPOCH
+    MM = moon_longitude - 0.1114041 * day - MOON_MEAN_PERIGEE_EPOCH
+
+    evection = 1.2739 * np.sin(np.radians(2 * (moon_longitude - lambda_sun) - MM))
+    annual_eq = 0.1858 * np.sin(np.radians(M))
+    A3 = 0.37 * np.sin(np.radians(M))
+
+    MmP = MM + evection - annual_eq - A3
+
+    mEc = 6.2886 * np.sin(np.radians(MmP))
+    A4 = 0.214 * np.sin(np.radians(2 * MmP))
+
+    lP = moon_longitude + evection + mEc - annual_eq + A4
+    variation = 0.6583 * np.sin(np.radians(2 * (lP - lambda_sun)))
+    lPP = lP + variation
+
+    # Calculation of the phase of the Moon
+
+    moon_age = lPP - lambda_sun
+    moon_phase = (1 - np.cos(np.radians(moon_age))) / 2.0
+
+    moon_dist = _MOON_DIST_NUM / (1 + MOON_ECCENTRICITY * np.cos(np.radians(MmP + mEc)))
+
+    moon_diam_frac = moon_dist / MOON_SMAXIS
+    moon_angular_diameter = MOON_ANGULAR_SIZE / moon_diam_frac
+
+    age_frac = np.mod(moon_age, 360.0) / 360.0
+
     res = {
-        'phase': norm_angle(moon_age) / 360.0,
+        'phase': age_frac,
         'illuminated': moon_phase,
-        'age': SYNODIC_MONTH * norm_angle(moon_age) / 360.0,
+        'age': SYNODIC_MONTH * age_frac,
         'distance': moon_dist,
         'angular_diameter': moon_angular_diameter,
         'sun_distance': sun_dist,
@@ -322,36 +574,75 @@ def phase(phase_date=datetime.utcnow()):
     return res
 
 
-def phase_hunt(sdate=datetime.utcnow()):
+def phase_hunt(sdate=None):
     """Find time of phases of the moon which surround the current date.
 
     Five phases are found, starting and ending with the new moons
-    which bound the current lunation.
+    which bound the current lunation.  The date defaults to now.
     """
 
-    adate = sdate - timedelta(days=45)
+    if sdate is None:
+        sdate = datetime.utcnow()
+    return list(_phase_hunt(_lunation(datetime_to_julian_days(sdate))))
 
-    k1 = floor((adate.year + ((adate.month - 1) * (1.0 / 12.0)) - 1900) * 12.3685)
 
-    nt1 = mean_phase(adate, k1)
-    adate_0 = nt1
+@functools.lru_cache(maxsize=4096)
+def _phase_hunt(k1):
+    """Do the work of phase_hunt() for the lunation with index K1.
 
-    while True:
-        adate_0 += SYNODIC_MONTH
-        k2 = k1 + 1
-        nt2 = mean_phase(julian_days_to_datetime(adate_0), k2)
-        if nt1 <= datetime_to_julian_days(sdate) < nt2:
-            break
-        nt1 = nt2
-        k1 = k2
+    Results are cached as a tuple.  They only depend on the lunation,
+    so every date within it shares one cache entry."""
+
+    k2 = k1 + 1
 
-    phases = list(map(true_phase,
-                      [k1, k1, k1, k1, k2],
-                      [0 / 4.0, 1 / 4.0, 2 / 4.0, 3 / 4.0, 0 / 4.0]))
+    phases = tuple(map(true_phase,
+                       [k1, k1, k1, k1, k2],
+                       [0 / 4.0, 1 / 4.0, 2 / 4.0, 3 / 4.0, 0 / 4.0]))
 
     return phases
 
 
+def phase_hunt_range(sdate, months):
+    """Find time of phases of the moon for a run of lunations.
+
+    Works like phase_hunt() for the lunation containing the date, and
+    for the MONTHS - 1 lunations following it, all at once.  The date
+    is either a DateTime or a Julian Day Number.
+
+    Returns a numpy array of Julian Day Numbers with one row of five
+    phases per lunation.  Requires NumPy."""
+
+    if np is None:
+        raise ImportError("phase_hunt_range() requires numpy")
+
+    if isinstance(sdate, datetime):
+        jdn = datetime_to_julian_days(sdate)
+    else:
+        jdn = sdate
+
+    k = _lunation(jdn) + np.arange(months, dtype=np.float64)[:, np.newaxis]
+    k = k + np.array([0.0, 0.0, 0.0, 0.0, 1.0])
+    tphase = np.array([0 / 4.0, 1 / 4.0, 2 / 4.0, 3 / 4.0, 0 / 4.0])
+
+    return _true_phase_vector(k, tphase)
+
+
+@njit(cache=True, fastmath=True)
+def _lunation(jdn):
+    """Find the index K of the last mean new moon before a Julian Day
+    Number."""
+
+    # Estimate the index directly, then correct the estimate if it is
+    # one lunation off.
+    k = floor((jdn - 2415020.75933) / SYNODIC_MONTH)
+    if jdn < _mean_phase(k):
+        k -= 1
+    elif _mean_phase(k + 1) <= jdn:
+        k += 1
+
+    return k
+
+
 def mean_phase(sdate, k):
     """Calculates time of the mean new Moon for a given base date.
 
@@ -369,23 +660,51 @@ def mean_phase(sdate, k):
 
     # square for frequent use
     t2 = t * t
-    # and cube
-    t3 = t2 * t
 
+    # Polynomials in t are written in Horner form
     nt1 = (
-            2415020.75933 + SYNODIC_MONTH * k + 0.0001178 * t2 -
-            0.000000155 * t3 + 0.00033 * dsin(166.56 + 132.87 * t -
-                                              0.009173 * t2)
+            2415020.75933 + SYNODIC_MONTH * k
+            + (0.0001178 - 0.000000155 * t) * t2
+            + 0.00033 * dsin(166.56 + (132.87 - 0.009173 * t) * t)
     )
 
     return nt1
 
 
+@njit(cache=True, fastmath=True)
+def _mean_phase(k):
+    """Calculates time of the mean new Moon for lunation index K.
+
+    Like mean_phase(), but with the time derived from K itself, as
+    true_phase() does."""
+
+    # Time in Julian centuries from 1900 January 0.5
+    t = k / 1236.85
+    t2 = t * t
+
+    return (
+            2415020.75933 + SYNODIC_MONTH * k
+            + (0.0001178 - 0.000000155 * t) * t2
+            + 0.00033 * dsin(166.56 + (132.87 - 0.009173 * t) * t)
+    )
+
+
 def true_phase(k, tphase):
     """Given a K value used to determine the mean phase of the new
     moon, and a phase selector (0.0, 0.25, 0.5, 0.75), obtain the
     true, corrected phase time."""
 
+    return julian_days_to_datetime(_true_phase(k, tphase))
+
+
+@njit(cache=True, fastmath=True)
+def _true_phase(k, tphase):
+    """Do the work of true_phase(), returning a Julian Day Number."""
+
+    sin_ = sin
+    dsin_ = dsin
+    dcos_ = dcos
+
     apcor = False
 
     # add phase to new moon time
@@ -394,69 +713,48 @@ def true_phase(k, tphase):
     t = k / 1236.85
 
     t2 = t * t
-    t3 = t2 * t
+
+    # Polynomials in t are written in Horner form
 
     # Mean time of phase
     pt = (
-            2415020.75933 + SYNODIC_MONTH * k + 0.0001178 * t2 -
-            0.000000155 * t3 + 0.00033 * dsin(166.56 + 132.87 * t -
-                                              0.009173 * t2)
+            2415020.75933 + SYNODIC_MONTH * k
+            + (0.0001178 - 0.000000155 * t) * t2
+            + 0.00033 * dsin_(166.56 + (132.87 - 0.009173 * t) * t)
     )
 
     # Sun's mean anomaly
-    m = 359.2242 + 29.10535608 * k - 0.0000333 * t2 - 0.00000347 * t3
+    m = 359.2242 + 29.10535608 * k - (0.0000333 + 0.00000347 * t) * t2
 
     # Moon's mean anomaly
-    mprime = 306.0253 + 385.81691806 * k + 0.0107306 * t2 + 0.00001236 * t3
+    mprime = 306.0253 + 385.81691806 * k + (0.0107306 + 0.00001236 * t) * t2
 
     # Moon's argument of latitude
-    f = 21.2964 + 390.67050646 * k - 0.0016528 * t2 - 0.00000239 * t3
+    f = 21.2964 + 390.67050646 * k - (0.0016528 + 0.00000239 * t) * t2
+
+    args = _correction_args(m, mprime, f)
 
     if (tphase < 0.01) or (abs(tphase - 0.5) < 0.01):
 
         # Corrections for New and Full Moon
-        pt = pt + (
-                (0.1734 - 0.000393 * t) * dsin(m)
-                + 0.0021 * dsin(2 * m)
-                - 0.4068 * dsin(mprime)
-                + 0.0161 * dsin(2 * mprime)
-                - 0.0004 * dsin(3 * mprime)
-                + 0.0104 * dsin(2 * f)
-                - 0.0051 * dsin(m + mprime)
-                - 0.0074 * dsin(m - mprime)
-                + 0.0004 * dsin(2 * f + m)
-                - 0.0004 * dsin(2 * f - m)
-                - 0.0006 * dsin(2 * f + mprime)
-                + 0.0010 * dsin(2 * f - mprime)
-                + 0.0005 * dsin(m + 2 * mprime)
-        )
+        cor = -0.000393 * t * dsin_(m)
+        for c, a in zip(_NEW_FULL_COEFFS, args):
+            cor += c * sin_(a * _D2R)
+        pt = pt + cor
 
         apcor = True
     elif (abs(tphase - 0.25) < 0.01) or (abs(tphase - 0.75) < 0.01):
 
-        pt = pt + (
-                (0.1721 - 0.0004 * t) * dsin(m)
-                + 0.0021 * dsin(2 * m)
-                - 0.6280 * dsin(mprime)
-                + 0.0089 * dsin(2 * mprime)
-                - 0.0004 * dsin(3 * mprime)
-                + 0.0079 * dsin(2 * f)
-                - 0.0119 * dsin(m + mprime)
-                - 0.0047 * dsin(m - mprime)
-                + 0.0003 * dsin(2 * f + m)
-                - 0.0004 * dsin(2 * f - m)
-                - 0.0006 * dsin(2 * f + mprime)
-                + 0.0021 * dsin(2 * f - mprime)
-                + 0.0003 * dsin(m + 2 * mprime)
-                + 0.0004 * dsin(m - 2 * mprime)
-                - 0.0003 * dsin(2 * m + mprime)
-        )
+        cor = -0.0004 * t * dsin_(m)
+        for c, a in zip(_QUARTER_COEFFS, args):
+            cor += c * sin_(a * _D2R)
+        pt = pt + cor
         if tphase < 0.5:
             #  First quarter correction
-            pt = pt + 0.0028 - 0.0004 * dcos(m) + 0.0003 * dcos(mprime)
+            pt = pt + 0.0028 - 0.0004 * dcos_(m) + 0.0003 * dcos_(mprime)
         else:
             #  Last quarter correction
-            pt = pt + -0.0028 + 0.0004 * dcos(m) - 0.0003 * dcos(mprime)
+            pt = pt + -0.0028 + 0.0004 * dcos_(m) - 0.0003 * dcos_(mprime)
         apcor = True
 
     if not apcor:
@@ -464,19 +762,107 @@ def true_phase(k, tphase):
             "TRUEPHASE called with invalid phase selector",
             tphase)
 
-    return julian_days_to_datetime(pt)
+    return pt
+
+
+# Coefficients of the periodic terms correcting the mean time of New
+# and Full Moon, and of the quarters, applied to the sines of the
+# arguments from _correction_args().  The first term of each also has
+# a part proportional to T, which true_phase() adds separately.
+_NEW_FULL_COEFFS = (
+    0.1734, 0.0021, -0.4068, 0.0161, -0.0004, 0.0104, -0.0051,
+    -0.0074, 0.0004, -0.0004, -0.0006, 0.0010, 0.0005)
+_QUARTER_COEFFS = (
+    0.1721, 0.0021, -0.6280, 0.0089, -0.0004, 0.0079, -0.0119,
+    -0.0047, 0.0003, -0.0004, -0.0006, 0.0021, 0.0003, 0.0004,
+    -0.0003)
+
 
+@njit(cache=True, fastmath=True)
+def _correction_args(m, mprime, f):
+    """Arguments of the periodic terms in true_phase(), given the Sun's
+    and the Moon's mean anomalies and the Moon's argument of latitude.
 
+    Works on plain floats as well as numpy arrays."""
+
+    return (m, 2 * m, mprime, 2 * mprime, 3 * mprime, 2 * f,
+            m + mprime, m - mprime, 2 * f + m, 2 * f - m,
+            2 * f + mprime, 2 * f - mprime, m + 2 * mprime,
+            m - 2 * mprime, 2 * m + mprime)
+
+
+def _true_phase_vector(k, tphase):
+    """Like _true_phase(), for arrays of K values and phase selectors.
+
+    The arrays are broadcast against each other; the result holds one
+    Julian Day Number per element."""
+
+    tphase = np.asarray(tphase, dtype=np.float64)
+    new_full = (tphase < 0.01) | (np.abs(tphase - 0.5) < 0.01)
+    quarter = (np.abs(tphase - 0.25) < 0.01) | (np.abs(tphase - 0.75) < 0.01)
+    if not np.all(new_full | quarter):
+        raise ValueError(
+            "TRUEPHASE called with invalid phase selector",
+            tphase[~(new_full | quarter)])
+
+    # add phase to new moon time
+    k = k + tphase
+    # Time in Julian centuries from 1900 January 0.5
+    t = k / 1236.85
+    t2 = t * t
+
+    # Mean time of phase
+    pt = (
+            2415020.75933 + SYNODIC_MONTH * k
+            + (0.0001178 - 0.000000155 * t) * t2
+            + 0.00033 * np.sin((166.56 + (132.87 - 0.009173 * t) * t) * _D2R)
+    )
+
+    # Sun's mean anomaly, the Moon's mean anomaly and the Moon's
+    # argument of latitude, in radians
+    m = (359.2242 + 29.10535608 * k - (0.0000333 + 0.00000347 * t) * t2) * _D2R
+    mprime = (306.0253 + 385.81691806 * k + (0.0107306 + 0.00001236 * t) * t2) * _D2R
+    f = (21.2964 + 390.67050646 * k - (0.0016528 + 0.00000239 * t) * t2) * _D2R
+
+    sines = np.sin(np.array(_correction_args(m, mprime, f)))
+    sin_m = sines[0]
+
+    # Corrections for New and Full Moon
+    new_full_cor = (
+            -0.000393 * t * sin_m
+            + np.tensordot(_NEW_FULL_COEFFS, sines[:len(_NEW_FULL_COEFFS)], axes=1)
+    )
+
+    # Corrections for the quarters; the last term flips sign between
+    # the first and the last quarter
+    quarter_cor = (
+            -0.0004 * t * sin_m
+            + np.tensordot(_QUARTER_COEFFS, sines, axes=1)
+            + np.where(tphase < 0.5, 1.0, -1.0)
+            * (0.0028 - 0.0004 * np.cos(m) + 0.0003 * np.cos(mprime))
+    )
+
+    return pt + np.where(new_full, new_full_cor, quarter_cor)
+
+
+@njit(cache=True, fastmath=True)
 def kepler(m, ecc):
-    """Solve the equation of Kepler."""
+    """Solve the equation of Kepler.
+
+    Newton's method converges in two or three steps for the small
+    eccentricities used here, so it stops as soon as it is done rather
+    than running a fixed number of higher-order steps."""
 
     epsilon = 1e-6
 
-    m = math.radians(m)
+    sin_ = sin
+    cos_ = cos
+
+    m = m * _D2R
     e = m
     while 1:
-        delta = e - ecc * sin(e) - m
-        e = e - delta / (1.0 - ecc * cos(e))
+        delta = e - ecc * sin_(e) - m
+        e = e - delta / (1.0 - ecc * cos_(e))
 
         if abs(delta) <= epsilon:
             break
@@ -484,6 +870,21 @@ def kepler(m, ecc):
     return e
 
 
+def kepler_vector(m, ecc):
+    """Solve the equation of Kepler for an array of mean anomalies.
+
+    Runs a fixed number of Newton steps over the whole array instead
+    of iterating each element to convergence; six steps are plenty for
+    the small eccentricities used here."""
+
+    m = np.radians(m)
+    e = m
+    for _ in range(6):
+        e = e - (e - ecc * np.sin(e) - m) / (1.0 - ecc * np.cos(e))
+
+    return e
+
+
 def main():
     m = MoonPhase()
     s = """The moon is %s, %.1f%% illuminated, %.1f days old.""" % \
@@ -3,9 +3,19 @@
 import unittest
 
 import math
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from moon import MoonPhase, datetime_to_julian_days, FIRST_QUARTER, NEW_MOON, FULL_MOON, LAST_QUARTER
+from moon import MoonPhase, datetime_to_days, datetime_to_julian_days, FIRST_QUARTER, NEW_MOON, FULL_MOON, LAST_QUARTER
+from moon import SYNODIC_MONTH, phase, phase_vector, phase_hunt, phase_hunt_range
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Prefixes of the MoonPhase *_date attributes, in lunation order
+_SEEK_PHASES = ('new', 'q1', 'full', 'q3', 'nextnew')
 
 
 class MoonPhaseConstruction(unittest.TestCase):
@@ -17,20 +27,29 @@ class MoonPhaseConstruction(unittest.TestCase):
     def test_datetime_construction(self):
         MoonPhase(datetime(2039, 7, 29))
 
+    def test_aware_datetime_construction(self):
+        cest = timezone(timedelta(hours=2))
+        self.assertEqual(MoonPhase(datetime(2039, 7, 29, 2, tzinfo=cest)).phase,
+                         MoonPhase(datetime(2039, 7, 29)).phase)
+
     def test_extra_arg_construction(self):
         self.assertRaises(TypeError, MoonPhase, 1234567, 4321765)
 
 
 class MoonPhaseAttributes(unittest.TestCase):
-    def setup(self):
-        self.o = MoonPhase()
+    _ATTRIBUTE_LIST = ('date',
+                       'phase', 'phase_text', 'illuminated',
+                       'angular_diameter', 'sun_angular_diameter',
+                       'new_date', 'q1_date',
+                       'full_date', 'q3_date', 'nextnew_date')
+
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read from the instance, so they can share it.
+        cls.o = MoonPhase()
 
     def test_presence(self):
-        for a in ['date',
-                  'phase', 'phase_text', 'illuminated',
-                  'angular_diameter', 'sun_angular_diameter',
-                  'new_date', 'q1_date',
-                  'full_date', 'q3_date', 'nextnew_date']:
+        for a in self._ATTRIBUTE_LIST:
             getattr(self.o, a)
 
     def test_absence(self):
@@ -114,16 +133,61 @@ LUNAR_DATA = [
 ]
 
 
+class DatetimeToDays(unittest.TestCase):
+    """Test datetime_to_days() against plain timedelta arithmetic."""
+
+    def test_against_timedelta(self):
+        dates = [dt for dt, _ in LUNAR_DATA]
+        dates += [datetime(1, 1, 1), datetime(2039, 7, 29, 23, 59, 59, 999999)]
+        for dt in dates:
+            expected = (dt - datetime(1, 1, 1)).total_seconds() / (60 * 60 * 24)
+            self.assertAlmostEqual(datetime_to_days(dt), expected, places=9,
+                                   msg=str(dt))
+
+
 class MoonPhaseAccuracy(unittest.TestCase):
     """Test output against trusted astronomical data."""
 
     tolerance = 0.001
-
+    # for any single date
+    point_tolerance = 0.002
+
+    @classmethod
+    def setUpClass(cls):
+        # Compile the Numba kernels behind phase() and phase_hunt(),
+        # when Numba is installed, up front so the scalar tests below
+        # only run the native code.  phase_vector() is plain NumPy.
+        o = MoonPhase(datetime(2000, 1, 1))
+        o.phase
+        o.key_dates
+
+    @unittest.skipIf(np is None, "numpy is not installed")
     def test_accuracy(self):
+        dates64 = np.array([dt for dt, _ in LUNAR_DATA], dtype='datetime64[s]')
+        phases_expected = np.array([phase for _, phase in LUNAR_DATA])
+
+        phases_actual = MoonPhase.phases_for_dates(dates64)
+
+        error = np.abs(phases_expected - phases_actual)
+        # phase is circular
+        error = np.minimum(error, 1.0 - error)
+        avg_error = error.mean()
+        self.assertTrue(avg_error < self.tolerance,
+                        "avg_error: %s" % avg_error)
+
+    def test_point_accuracy(self):
+        for dt, expected in LUNAR_DATA:
+            with self.subTest(dt=dt):
+                error = abs(expected - MoonPhase(dt).phase)
+                # phase is circular
+                error = min(error, 1.0 - error)
+                self.assertLess(error, self.point_tolerance)
+
+    def test_scalar_accuracy(self):
         total_error = 0.0
-        for dt, phase in LUNAR_DATA:
+        for dt, expected in LUNAR_DATA:
             o = MoonPhase(dt)
-            error = abs(phase - o.phase)
+            error = abs(expected - o.phase)
             if error > 0.5:
                 # phase is circular
                 error = 1.0 - error
@@ -134,25 +198,77 @@ class MoonPhaseAccuracy(unittest.TestCase):
                         "avg_error: %s" % avg_error)
 
 
+@unittest.skipIf(np is None, "numpy is not installed")
+class MoonPhaseVector(unittest.TestCase):
+    """Test phase_vector() against the scalar phase()."""
+
+    def check_against_scalar(self, dates):
+        res = phase_vector(dates)
+        for i, (dt, _) in enumerate(LUNAR_DATA):
+            expected = phase(dt)
+            for k, v in expected.items():
+                self.assertAlmostEqual(res[k][i], v, delta=1e-6 * (1 + abs(v)),
+                                       msg="%s for %s" % (k, dt))
+
+    def test_datetime64(self):
+        self.check_against_scalar(
+            np.array([dt for dt, _ in LUNAR_DATA], dtype='datetime64[us]'))
+
+    def test_datetime64_ns(self):
+        # pandas' default resolution
+        self.check_against_scalar(
+            np.array([dt for dt, _ in LUNAR_DATA], dtype='datetime64[ns]'))
+
+    def test_datetime(self):
+        self.check_against_scalar([dt for dt, _ in LUNAR_DATA])
+
+    def test_julian_days(self):
+        self.check_against_scalar(
+            np.array([datetime_to_julian_days(dt) for dt, _ in LUNAR_DATA]))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class MoonPhaseHuntRange(unittest.TestCase):
+    """Test phase_hunt_range() against the scalar phase_hunt()."""
+
+    def test_against_scalar(self):
+        dt = datetime(1989, 1, 7, 19, 22)
+        res = phase_hunt_range(dt, 12)
+        self.assertEqual(res.shape, (12, 5))
+        for row in res:
+            dates = phase_hunt(dt)
+            for jdn, date in zip(row, dates):
+                self.assertAlmostEqual(jdn, datetime_to_julian_days(date), places=6)
+            # the full moon of the next lunation
+            dt = dates[2] + timedelta(days=SYNODIC_MONTH)
+
+
 class MoonPhaseSeek(unittest.TestCase):
     tolerance = 0.001
 
-    def setup(self):
-        self.o = MoonPhase()
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read from the instance, so they can share it.
+        cls.o = MoonPhase()
 
     def test_attribute_presence(self):
-        for p in ['new', 'q1', 'full', 'q3', 'nextnew']:
+        for p in _SEEK_PHASES:
             self.assertTrue(isinstance(getattr(self.o, f"{p}_date"), datetime))
 
+    def test_key_dates(self):
+        self.assertEqual(self.o.key_dates,
+                         tuple(getattr(self.o, f"{p}_date") for p in _SEEK_PHASES))
+
     def test_ballpark_accuracy(self):
-        for p in ['new', 'q1', 'full', 'q3', 'nextnew']:
+        base_jd = datetime_to_julian_days(self.o.date)
+        for p in _SEEK_PHASES:
             dt = getattr(self.o, f"{p}_date")
-            if abs(datetime_to_julian_days(self.o.date) - datetime_to_julian_days(dt)) > 30:
+            if abs(base_jd - datetime_to_julian_days(dt)) > 30:
                 self.fail("%s more than a month away" % p)
 
     def test_sanity_check(self):
         phase = 0.0
-        for p in ['new', 'q1', 'full', 'q3', 'nextnew']:
+        for p in _SEEK_PHASES:
             dt = getattr(self.o, f"{p}_date")
             gap = abs(MoonPhase(dt).phase - phase)
             if gap > 0.5:
@@ -5,7 +5,12 @@ from mx import DateTime
 from datetime import datetime, tzinfo, timedelta
 import time
 
-from moon import datetime_to_days, datetime_to_julian_days, julian_days_to_datetime
+from moon import datetime_to_days, datetime_to_julian_days, datetime_to_julian_days_vec, julian_days_to_datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class UTC(tzinfo):
@@ -29,8 +34,6 @@ class MxTimeTest(unittest.TestCase):
         now = DateTime.now()
         print(now)
 
-        # embed()
-
         print("Abs days", now.absdays)
         print("Abs time", now.abstime)
 
@@ -114,9 +117,28 @@ class MxTimeTest(unittest.TestCase):
         minute = 12
         second = 23
 
+        inputs = []
         for i in range(1000):
+            inputs.append((year, month, day, hour, minute, second))
+
+            year += 3
+            month += 3
+            day += 3
+            hour += 3
+            minute += 3
+            second += 3
+
+            month = month % 12 + 1
+            day = day % 28 + 1
+            hour = hour % 24
+            minute = minute % 60
+            second = second % 60
+
+        jd_mx = []
+        for year, month, day, hour, minute, second in inputs:
             dt_mx = DateTime.DateTimeFrom(year=year, month=month, day=day,
                                           hour=hour, minute=minute, second=second)
+            jd_mx.append(dt_mx.jdn)
 
             dt = datetime(year, month, day, hour, minute, second)
 
@@ -130,19 +152,19 @@ class MxTimeTest(unittest.TestCase):
 
             assert dt_ticks - 1 < dt_mx_ticks < dt_ticks + 1
 
-            year += 3
-            month += 3
-            day += 3
-            hour += 3
-            minute += 3
-            second += 3
-
-            month = month % 12 + 1
-            day = day % 28 + 1
-            hour = hour % 24
-            minute = minute % 60
-            second = second % 60
-
+        if np is not None:
+            years, months, days, hours, minutes, seconds = np.array(inputs, dtype=np.int64).T
+            dates64 = (
+                    ((years - 1970).astype('datetime64[Y]')
+                     + (months - 1).astype('timedelta64[M]')).astype('datetime64[D]')
+                    + (days - 1).astype('timedelta64[D]')
+                    + hours.astype('timedelta64[h]')
+                    + minutes.astype('timedelta64[m]')
+                    + seconds.astype('timedelta64[s]')
+            )
+            jd_vec = datetime_to_julian_days_vec(dates64)
+
+            assert np.allclose(jd_vec, jd_mx, rtol=0, atol=1e-8)
 
 if __name__ == "__main__":
     unittest.main()
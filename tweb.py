@@ -8,65 +8,64 @@ try:
 except ImportError:
     import DateTime
 
+# Fields of the date, in the order they are read from the request path
+DATE_FIELDS = ('year','month','day','hour','minute','second')
+
+def _maybe_int(value):
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return value
+
 class MoonResource(resource.Resource):
     isLeaf = True
     def render(self, request):
-	args = {}
-
-	postpath = request.postpath[:]
-	for t in ('year','month','day','hour','minute','second'):
-	    if postpath:
-		args[t] = postpath.pop(0)
-	    else:
-		break
+        args = {}
 
-	for k in request.args.keys():
-	    if request.args[k]:
-		args[k] = request.args[k][-1]
+        for t, v in zip(DATE_FIELDS, request.postpath):
+            args[t] = _maybe_int(v)
 
-	for k in args.keys():
-	    try:
-		args[k] = int(args[k])
-	    except (ValueError, TypeError):
-		pass
+        for k, v in request.args.items():
+            if v:
+                args[k.decode('utf-8')] = _maybe_int(v[-1])
 
-	if args:
-	    date = apply(DateTime.DateTimeFrom,[],args)
-	else:
-	    date = DateTime.now()
+        if args:
+            date = DateTime.DateTimeFrom(**args)
+        else:
+            date = DateTime.now()
 
-	return self.render_for_date(date)
+        return self.render_for_date(date).encode('utf-8')
 
     def render_for_date(self, date):
 
-	timestring = "%s<br />\nJulian Day Number %d\n" % (
-	    date.strftime('%X (at %Z) on<br />\n%A, %d %B,'
+        timestring = "%s<br />\nJulian Day Number %d\n" % (
+            date.strftime('%X (at %Z) on<br />\n%A, %d %B,'
                           ' in the year %Y'),
-	    date.jdn)
+            date.jdn)
 
-	phase = moon.MoonPhase(date)
+        phase = moon.MoonPhase(date.pydatetime())
 
-	s = "phase: %f<br />\n" \
-	    "The moon is %s, %%%.2f full.  (%.1f days old)<br />\n" \
-	    "Angular diameter: %.4f&deg;\n" % \
-	    (phase.phase,
-	     phase.phase_text,
-	     phase.illuminated * 100,
-	     phase.age,
-	     phase.angular_diameter)
-
-        t = """<table border=\"1\">""" \
-            """    <tr><th>Phase</th><th>Date</th><th>Days</th></tr>\n"""
+        s = "phase: %f<br />\n" \
+            "The moon is %s, %%%.2f full.  (%.1f days old)<br />\n" \
+            "Angular diameter: %.4f&deg;\n" % \
+            (phase.phase,
+             phase.phase_text,
+             phase.illuminated * 100,
+             phase.age,
+             phase.angular_diameter)
 
         labels = ["New", "1st Quarter", "Full", "3rd Quarter", "New"]
-        atts = ['new','q1','full','q3','nextnew']
-
-        for a, label in map(None, atts, labels):
-            d = getattr(phase, "%s_date" % a)
-            r = """<tr>\n    <td>%s</td><td>%s</td>""" \
-                """<td align="right">%.2f</td>\n""" % \
-                (label, str(d), d.jdn - phase.date.jdn)
-            t = t + r
-        t = t + "</table>\n"
 
-	return "<p>%s</p><p>%s</p>\n%s" % (timestring, s, t)
+        parts = ["""<table border=\"1\">"""
+                 """    <tr><th>Phase</th><th>Date</th><th>Days</th></tr>\n"""]
+        for label, d in zip(labels, phase.key_dates):
+            parts.append("""<tr>\n    <td>%s</td><td>%s</td>"""
+                         """<td align="right">%.2f</td>\n""" %
+                         (label, str(d),
+                          moon.datetime_to_julian_days(d) - date.jdn))
+        parts.append("</table>\n")
+        t = "".join(parts)
+
+        return "<p>%s</p><p>%s</p>\n%s" % (timestring, s, t)